@@ -1,11 +1,12 @@
 
 import { useState } from 'react'
 import { motion, AnimatePresence } from 'framer-motion'
+import { debug } from '../lib/log.js'
 
 export function SlideViewer({ slides = [] }) {
   const [currentSlide, setCurrentSlide] = useState(0)
   
-  console.log('SlideViewer received slides:', slides)
+  debug('SlideViewer received slides:', slides)
 
   if (!slides || slides.length === 0) {
     return (
@@ -2,12 +2,206 @@
 // Minimal Anthropic Messages API client for the browser.
 // NOTE: For production, proxy this request through a backend to keep the API key secret.
 
+import { createTtlCache, createWordSetCache } from './cache.js'
+import { createJsonScanner, extractJson } from './json.js'
+
 const DEFAULT_MODEL = 'claude-3-5-sonnet-latest'
 
-export async function generateInvestorsWithAnthropic({ profile, apiKey }) {
-  if (!apiKey) throw new Error('Missing Anthropic API key')
+// Defaults to a same-origin path proxied to api.anthropic.com (Vite dev server and vercel.json rewrite),
+// so the custom headers below don't trigger a CORS preflight before every call. Hosts without a proxy
+// can point VITE_ANTHROPIC_BASE_URL at https://api.anthropic.com instead.
+const USES_PROXY = !import.meta.env.VITE_ANTHROPIC_BASE_URL
+const MESSAGES_URL = (import.meta.env.VITE_ANTHROPIC_BASE_URL || '/anthropic') + '/v1/messages'
+
+// Built once and shared by every call; fetch keeps the connection to the API alive between requests.
+const BASE_HEADERS = Object.freeze({
+  'Content-Type': 'application/json',
+  'anthropic-version': '2023-06-01',
+  // Required by Anthropic for any browser-originating requests
+  'anthropic-dangerous-direct-browser-access': 'true',
+})
+
+// Rate limits, overload (529) and transient server errors are retried with exponential backoff,
+// honouring Retry-After when the API sends it; everything else surfaces immediately.
+const RETRY_STATUSES = new Set([429, 500, 502, 503, 504, 529])
+const MAX_RETRIES = 3
+const RETRY_BACKOFF_MS = 300
+const MAX_RETRY_DELAY_MS = 10_000
+// How long the API may stay silent (before answering, or between chunks of the stream) so a stalled
+// connection doesn't leave the UI spinning forever; a long report that keeps streaming is never cut off.
+const IDLE_TIMEOUT_MS = 60_000
+
+function sleep(ms, signal) {
+  return new Promise((resolve, reject) => {
+    signal.throwIfAborted()
+    const onAbort = () => {
+      clearTimeout(timer)
+      reject(signal.reason)
+    }
+    const timer = setTimeout(() => {
+      signal.removeEventListener('abort', onAbort)
+      resolve()
+    }, ms)
+    signal.addEventListener('abort', onAbort, { once: true })
+  })
+}
+
+// Completions keyed by the exact request body, so identical prompts (re-mounts, repeated clicks) skip the API.
+const responseCache = createTtlCache({ ttlMs: 60 * 60 * 1000, maxEntries: 128 })
+const inFlight = new Map()
+
+// Request fields that never change between calls.
+const BASE_BODY = Object.freeze({ model: DEFAULT_MODEL, stream: true })
+
+// Headers for the most recently used key, rebuilt only when the key changes.
+let cachedHeaders = { apiKey: null, headers: null }
+
+function headersFor(apiKey) {
+  if (cachedHeaders.apiKey !== apiKey) {
+    cachedHeaders = { apiKey, headers: Object.freeze({ ...BASE_HEADERS, 'x-api-key': apiKey }) }
+  }
+  return cachedHeaders.headers
+}
+
+/**
+ * POST a single-turn conversation to the Messages API and return the text of the first content block.
+ * `open` ('[' or '{') is the bracket the expected JSON value starts with; only completions holding
+ * such a value are cached. Pass `bypassCache` to force a new completion for a prompt that was already
+ * answered. While the response is still streaming, `onItem` receives each element of the returned
+ * JSON value and `onPartial` the value with every element completed so far.
+ */
+async function createMessage({ apiKey, system, prompt, maxTokens, open, bypassCache = false, onItem, onPartial }) {
+  const body = JSON.stringify({
+    ...BASE_BODY,
+    max_tokens: maxTokens,
+    system,
+    messages: [
+      { role: 'user', content: prompt },
+    ],
+  })
+  if (!bypassCache) {
+    const cached = responseCache.get(body)
+    if (cached !== undefined) return cached
+  }
+
+  // Identical requests issued while one is still running share its result instead of hitting the API again.
+  const pending = inFlight.get(body)
+  if (pending) return pending
+  const request = sendMessage(apiKey, body, open, { onItem, onPartial }).finally(() => inFlight.delete(body))
+  inFlight.set(body, request)
+  return request
+}
+
+async function sendMessage(apiKey, body, open, listeners) {
+  const controller = new AbortController()
+  let timer
+  // Restarted by every attempt and every chunk read; aborts once the API has been silent too long.
+  const touch = () => {
+    clearTimeout(timer)
+    timer = setTimeout(() => controller.abort(new DOMException('Idle timeout', 'TimeoutError')), IDLE_TIMEOUT_MS)
+  }
+  const init = {
+    method: 'POST',
+    headers: headersFor(apiKey),
+    body,
+    signal: controller.signal,
+  }
+
+  try {
+    const res = await fetchWithRetry(init, touch)
+    if (USES_PROXY && isMissingProxy(res)) {
+      throw new Error(`No Anthropic API proxy at ${MESSAGES_URL} (HTTP ${res.status}); add one or set VITE_ANTHROPIC_BASE_URL=https://api.anthropic.com`)
+    }
+    if (!res.ok) {
+      const text = await res.text().catch(() => '')
+      throw new Error(`Anthropic error ${res.status}: ${text}`)
+    }
+
+    const text = await readJsonStream(res, open, { ...listeners, onRead: touch })
+    // Refusals, prose and truncated values aren't cached, so the next attempt asks the API again.
+    if (extractJson(text, open) !== undefined) responseCache.set(body, text)
+    return text
+  } catch (e) {
+    if (e?.name === 'TimeoutError') throw new Error('Anthropic request timed out')
+    throw e
+  } finally {
+    clearTimeout(timer)
+  }
+}
+
+// Static hosts without the /anthropic rewrite answer with their own 404/405 page, or serve
+// index.html through the SPA fallback; the API itself only sends event streams and JSON errors.
+function isMissingProxy(res) {
+  const type = res.headers.get('content-type') || ''
+  if (res.ok) return !type.includes('text/event-stream')
+  return (res.status === 404 || res.status === 405) && !type.includes('application/json')
+}
+
+async function fetchWithRetry(init, touch) {
+  for (let attempt = 0; ; attempt++) {
+    touch()
+    const res = await fetch(MESSAGES_URL, init)
+    if (!RETRY_STATUSES.has(res.status) || attempt >= MAX_RETRIES) return res
+    // Release the connection held by the discarded response before waiting.
+    res.body?.cancel().catch(() => {})
+    const retryAfterMs = Number(res.headers.get('retry-after')) * 1000 || 0
+    await sleep(Math.min(Math.max(RETRY_BACKOFF_MS * 2 ** attempt, retryAfterMs), MAX_RETRY_DELAY_MS), init.signal)
+  }
+}
+
+/**
+ * Collect the text deltas of a streamed response. Every prompt asks for a single JSON value starting
+ * with `open`, so the stream is cancelled as soon as that value is closed instead of waiting for any
+ * trailing prose.
+ * `onItem` receives each object/array nested directly in that value as soon as it has fully arrived,
+ * and `onPartial` the value itself, closed right after that element. `onRead` is called for every
+ * chunk received.
+ */
+async function readJsonStream(res, open, { onItem, onPartial, onRead } = {}) {
+  const reader = res.body.pipeThrough(new TextDecoderStream()).getReader()
+  let text = ''
+  const scanner = createJsonScanner({
+    open,
+    onChild: (onItem || onPartial) && ((start, end, rootStart) => {
+      let item, partial
+      try {
+        if (onItem) item = JSON.parse(text.slice(start, end))
+        if (onPartial) partial = JSON.parse(text.slice(rootStart, end) + (open === '{' ? '}' : ']'))
+      } catch {
+        return
+      }
+      onItem?.(item)
+      onPartial?.(partial)
+    }),
+  })
+  let buffer = ''
+  try {
+    for (;;) {
+      const { value, done } = await reader.read()
+      if (done) return text
+      onRead?.()
+      buffer += value
+      const lines = buffer.split('\n')
+      buffer = lines.pop()
+      for (const line of lines) {
+        if (!line.startsWith('data:')) continue
+        const event = JSON.parse(line.slice(5))
+        if (event.type === 'error') {
+          throw new Error(`Anthropic error: ${event.error?.type || ''} ${event.error?.message || ''}`.trim())
+        }
+        if (event.type !== 'content_block_delta' || event.delta?.type !== 'text_delta') continue
+        const offset = text.length
+        text += event.delta.text
+        const end = scanner.push(event.delta.text)
+        if (end !== -1) return text.slice(0, offset + end)
+      }
+    }
+  } finally {
+    reader.cancel().catch(() => {})
+  }
+}
 
-  const system = `You are a startup investor matchmaker. Given a startup profile, pick investors who are a strong fit for the profile's stage and topic. Return a concise JSON array tailored to the inputs.
+const INVESTORS_SYSTEM_PROMPT = `You are a startup investor matchmaker. Given a startup profile, pick investors who are a strong fit for the profile's stage and topic. Return a concise JSON array tailored to the inputs.
 
 Rules:
 - Output ONLY valid JSON, no backticks, no commentary
@@ -28,56 +222,24 @@ Rules:
 - Prefer investors with visible interest in the inferred sectors from the text.
 - Avoid generic choices; rank by fit_score descending.`
 
-  const prompt = `Startup profile (use this aggressively):\n${JSON.stringify(profile, null, 2)}\n\nInfer sectors from problem/solution text. Map launch timeframe or stage_hint to stages. Return ONLY a JSON array.`
-
-  const url = (import.meta.env.DEV ? '/anthropic' : 'https://api.anthropic.com') + '/v1/messages'
-  const res = await fetch(url, {
-    method: 'POST',
-    headers: {
-      'Content-Type': 'application/json',
-      'x-api-key': apiKey,
-      'anthropic-version': '2023-06-01',
-      // Required by Anthropic for any browser-originating requests
-      'anthropic-dangerous-direct-browser-access': 'true',
-    },
-    body: JSON.stringify({
-      model: DEFAULT_MODEL,
-      max_tokens: 1200,
-      system,
-      messages: [
-        { role: 'user', content: prompt },
-      ],
-    }),
-  })
+export async function generateInvestorsWithAnthropic({ profile, apiKey, bypassCache = false, onInvestor }) {
+  if (!apiKey) throw new Error('Missing Anthropic API key')
 
-  if (!res.ok) {
-    const text = await res.text().catch(() => '')
-    throw new Error(`Anthropic error ${res.status}: ${text}`)
-  }
+  const prompt = `Startup profile (use this aggressively):\n${JSON.stringify(profile)}\n\nInfer sectors from problem/solution text. Map launch timeframe or stage_hint to stages. Return ONLY a JSON array.`
 
-  const data = await res.json()
-  // Anthropic returns content as an array of blocks; we expect a single text block
-  const text = data?.content?.[0]?.text ?? ''
-  try {
-    const parsed = JSON.parse(text)
-    if (!Array.isArray(parsed)) throw new Error('Expected array')
-    return parsed
-  } catch {
-    // Fallback: try to extract the first JSON array inside
-    const match = text.match(/\[[\s\S]*\]/)
-    if (match) {
-      try { return JSON.parse(match[0]) } catch {}
-    }
-    throw new Error('Model did not return JSON')
-  }
+  const text = await createMessage({ apiKey, system: INVESTORS_SYSTEM_PROMPT, prompt, maxTokens: 1200, open: '[', bypassCache, onItem: onInvestor })
+  const parsed = extractJson(text, '[')
+  if (!Array.isArray(parsed)) throw new Error('Model did not return JSON')
+  return parsed
 }
 
 
 /**
  * Generate a concise, investor-ready pitch deck outline following a strict slide structure.
  * Returns an array of 12 slides with: number, title, subtitle, bullets[], and optional metrics.
+ * `onSlide` is called with each slide as soon as it has streamed in.
  */
-export async function generatePitchDeckWithAnthropic({ profile, apiKey }) {
+export async function generatePitchDeckWithAnthropic({ profile, apiKey, bypassCache = false, onSlide }) {
   if (!apiKey) throw new Error('Missing Anthropic API key')
 
   const voiceTone = profile?.brandTone || 'clear, confident, concise'
@@ -123,58 +285,40 @@ ${JSON.stringify({
   milestones: profile?.milestones || '',
   notes: profile?.notes || '',
   launchWeeks: profile?.launchWeeks || '',
-}, null, 2)}
+})}
 
 Return ONLY a JSON array with 12 items in the specified order. Avoid duplicates. If information is missing, infer carefully and keep conservative.`
 
-  const url = (import.meta.env.DEV ? '/anthropic' : 'https://api.anthropic.com') + '/v1/messages'
-  const res = await fetch(url, {
-    method: 'POST',
-    headers: {
-      'Content-Type': 'application/json',
-      'x-api-key': apiKey,
-      'anthropic-version': '2023-06-01',
-      'anthropic-dangerous-direct-browser-access': 'true',
-    },
-    body: JSON.stringify({
-      model: DEFAULT_MODEL,
-      max_tokens: 2200,
-      system,
-      messages: [
-        { role: 'user', content: prompt },
-      ],
-    }),
+  let streamed = 0
+  const onItem = onSlide && ((s) => {
+    if (isSlide(s)) onSlide(normalizeSlide(s, streamed++))
   })
+  const text = await createMessage({ apiKey, system, prompt, maxTokens: 2200, open: '[', bypassCache, onItem })
+  const parsed = extractJson(text, '[')
+  if (!Array.isArray(parsed)) throw new Error('Model did not return JSON')
+  return parsed.filter(isSlide).map(normalizeSlide)
+}
 
-  if (!res.ok) {
-    const text = await res.text().catch(() => '')
-    throw new Error(`Anthropic error ${res.status}: ${text}`)
-  }
-
-  const data = await res.json()
-  const text = data?.content?.[0]?.text ?? ''
-  try {
-    const parsed = JSON.parse(text)
-    if (!Array.isArray(parsed)) throw new Error('Expected array')
-    return parsed
-  } catch {
-    const match = text.match(/\[[\s\S]*\]/)
-    if (match) {
-      try { return JSON.parse(match[0]) } catch {}
-    }
-    throw new Error('Model did not return JSON')
+const isSlide = (s) => s && typeof s === 'object' && !Array.isArray(s)
+
+// Coerce model output into a predictable slide shape once, so views don't re-check it on every render.
+function normalizeSlide(s, i) {
+  return {
+    ...s,
+    number: s.number || i + 1,
+    bullets: (Array.isArray(s.bullets) ? s.bullets : String(s.bullets || '').split(/\n|•|-/))
+      .map((b) => String(b).trim())
+      .filter(Boolean),
+    metrics: s.metrics && typeof s.metrics === 'object' ? s.metrics : null,
   }
 }
 
 
-/**
- * Generate comprehensive market research report using Anthropic Claude API
- * Returns a structured market research report with analysis and recommendations
- */
-export async function generateMarketResearchWithAnthropic({ profile, problemStatement, userAnswers, apiKey }) {
-  if (!apiKey) throw new Error('Missing Anthropic API key')
+export const MAX_PROBLEM_STATEMENT_LENGTH = 1000
+
+const marketResearchCache = createWordSetCache({ ttlMs: 60 * 60 * 1000, maxEntries: 64 })
 
-  const system = `You are a senior McKinsey & Company consultant specializing in market intelligence and strategic analysis. Generate a world-class, C-suite executive market research report that would be presented to Fortune 500 CEOs and board members.
+const MARKET_RESEARCH_SYSTEM_PROMPT = `You are a senior McKinsey & Company consultant specializing in market intelligence and strategic analysis. Generate a world-class, C-suite executive market research report that would be presented to Fortune 500 CEOs and board members.
 
 Your analysis must be:
 - PROFESSIONAL: Use McKinsey-level business language and frameworks
@@ -222,22 +366,8 @@ Return ONLY valid JSON with this exact structure:
   "conclusion": "Strategic conclusion with 3 key executive takeaways, market opportunity summary, and next steps for leadership team."
 }`
 
-  const prompt = `Startup Profile Context:
-${JSON.stringify({
-  startupName: profile?.startupName || 'The Startup',
-  brandTone: profile?.brandTone || 'professional and clear',
-  problem: profile?.problem || '',
-  solution: profile?.solution || '',
-  linkedin: profile?.linkedin || '',
-  launchWeeks: profile?.launchWeeks || '',
-  milestones: profile?.milestones || '',
-  notes: profile?.notes || ''
-}, null, 2)}
-
-Problem Statement:
-${problemStatement}
-
-Generate a comprehensive, McKinsey-quality market intelligence report following the specified JSON structure. 
+// Fixed tail of every market research prompt, after the per-startup context.
+const MARKET_RESEARCH_INSTRUCTIONS = `Generate a comprehensive, McKinsey-quality market intelligence report following the specified JSON structure. 
 
 Key Requirements:
 1. Use the startup profile context to create highly specific, tailored insights
@@ -249,43 +379,62 @@ Key Requirements:
 
 This report will be presented to investors and executive leadership, so ensure it meets Fortune 500 consulting standards.`
 
-  const url = (import.meta.env.DEV ? '/anthropic' : 'https://api.anthropic.com') + '/v1/messages'
-  const res = await fetch(url, {
-    method: 'POST',
-    headers: {
-      'Content-Type': 'application/json',
-      'x-api-key': apiKey,
-      'anthropic-version': '2023-06-01',
-      'anthropic-dangerous-direct-browser-access': 'true',
-    },
-    body: JSON.stringify({
-      model: DEFAULT_MODEL,
-      max_tokens: 3000,
-      system,
-      messages: [
-        { role: 'user', content: prompt },
-      ],
-    }),
-  })
-
-  if (!res.ok) {
-    const text = await res.text().catch(() => '')
-    throw new Error(`Anthropic error ${res.status}: ${text}`)
+/**
+ * Generate comprehensive market research report using Anthropic Claude API
+ * Returns a structured market research report with analysis and recommendations
+ * `onProgress` receives the report with the sections completed so far while it streams in.
+ */
+export async function generateMarketResearchWithAnthropic({ profile, problemStatement, userAnswers, apiKey, bypassCache = false, onProgress }) {
+  if (!apiKey) throw new Error('Missing Anthropic API key')
+  // Reject unusable input before building prompts or touching the cache; length is checked before trimming.
+  if (typeof problemStatement !== 'string' || problemStatement.length > MAX_PROBLEM_STATEMENT_LENGTH) {
+    throw new Error(`Problem statement must be text of at most ${MAX_PROBLEM_STATEMENT_LENGTH} characters`)
+  }
+  if (!problemStatement.trim()) throw new Error('Missing problem statement')
+  if (userAnswers != null && !Array.isArray(userAnswers)) throw new Error('User answers must be a list')
+
+  const context = {
+    startupName: profile?.startupName || 'The Startup',
+    brandTone: profile?.brandTone || 'professional and clear',
+    problem: profile?.problem || '',
+    solution: profile?.solution || '',
+    linkedin: profile?.linkedin || '',
+    launchWeeks: profile?.launchWeeks || '',
+    milestones: profile?.milestones || '',
+    notes: profile?.notes || ''
   }
 
-  const data = await res.json()
-  const text = data?.content?.[0]?.text ?? ''
-  try {
-    const parsed = JSON.parse(text)
-    if (typeof parsed !== 'object') throw new Error('Expected object')
-    return parsed
-  } catch {
-    const match = text.match(/\{[\s\S]*\}/)
-    if (match) {
-      try { return JSON.parse(match[0]) } catch {}
-    }
-    throw new Error('Model did not return valid JSON')
+  // Reports for the same startup are reused when the problem is only reworded.
+  const answers = (userAnswers || []).map((a) => [String(a?.question ?? '').trim(), String(a?.answer ?? '').trim()])
+  const cacheScope = JSON.stringify({ ...context, problem: undefined, answers })
+  const cacheText = `${context.problem}\n${problemStatement}`
+  if (!bypassCache) {
+    const cached = marketResearchCache.get(cacheScope, cacheText)
+    if (cached) return cached
   }
+
+  const answersText = answers
+    .filter(([question, answer]) => question || answer)
+    .map(([question, answer], i) => `Q${i + 1}: ${question || 'Unknown question'}\nA${i + 1}: ${answer || 'No answer provided'}`)
+    .join('\n')
+  const prompt = `Startup Profile Context:
+${JSON.stringify(context)}
+
+Problem Statement:
+${problemStatement}
+${answersText && `\nFounder Answers:\n${answersText}\n`}
+${MARKET_RESEARCH_INSTRUCTIONS}`
+
+  const text = await createMessage({ apiKey, system: MARKET_RESEARCH_SYSTEM_PROMPT, prompt, maxTokens: 3000, open: '{', bypassCache, onPartial: onProgress })
+  const report = parseReport(text)
+  marketResearchCache.set(cacheScope, cacheText, report)
+  return report
+}
+
+function parseReport(text) {
+  const parsed = extractJson(text, '{')
+  if (!parsed) throw new Error('Model did not return valid JSON')
+  return parsed
 }
 
 
@@ -0,0 +1,62 @@
+
+// Small in-memory caches for generated content, shared for the lifetime of the tab.
+
+const STOPWORDS = new Set(['a', 'an', 'and', 'at', 'for', 'in', 'into', 'of', 'on', 'or', 'the', 'to', 'with'])
+
+/**
+ * Lowercase words of a text with punctuation and filler words removed, as a set.
+ */
+export function wordSet(text) {
+  const words = String(text || '').toLowerCase().match(/[\p{L}\p{N}]+/gu) || []
+  return new Set(words.filter((w) => !STOPWORDS.has(w)))
+}
+
+/**
+ * Cache keyed on the words of a text regardless of order, case, punctuation and filler words, so a
+ * reworded statement ("EV charging market in France" vs "France EV charging market") finds the same
+ * entry while changing any other word misses. Entries only match within the same exact `scope` string.
+ * Values are cloned on the way in and out so callers can mutate what they get back.
+ */
+export function createWordSetCache({ ttlMs, maxEntries } = {}) {
+  const cache = createTtlCache({ ttlMs, maxEntries })
+  const keyFor = (scope, text) => JSON.stringify([scope, [...wordSet(text)].sort()])
+
+  return {
+    get(scope, text) {
+      const value = cache.get(keyFor(scope, text))
+      return value === undefined ? undefined : structuredClone(value)
+    },
+
+    set(scope, text, value) {
+      cache.set(keyFor(scope, text), structuredClone(value))
+    },
+  }
+}
+
+/**
+ * Exact-match cache with a time-to-live; the least recently used entry is dropped once `maxEntries`
+ * is reached.
+ */
+export function createTtlCache({ ttlMs = 60 * 60 * 1000, maxEntries = 128 } = {}) {
+  const entries = new Map()
+
+  return {
+    get(key) {
+      const entry = entries.get(key)
+      if (!entry) return undefined
+      if (entry.expires <= Date.now()) {
+        entries.delete(key)
+        return undefined
+      }
+      entries.delete(key)
+      entries.set(key, entry)
+      return entry.value
+    },
+
+    set(key, value) {
+      entries.delete(key)
+      entries.set(key, { value, expires: Date.now() + ttlMs })
+      if (entries.size > maxEntries) entries.delete(entries.keys().next().value)
+    },
+  }
+}
@@ -0,0 +1,79 @@
+
+// Helpers for reading JSON out of model output as it streams in.
+
+/**
+ * Incremental scanner for the first valid top-level JSON value starting with `open` ('[' or '{') in
+ * a stream of text. Tracks bracket depth (ignoring brackets inside strings) so callers can stop
+ * reading as soon as the value is closed; a bracketed span that doesn't parse (e.g. "[note]" in
+ * leading prose) is skipped and scanning resumes after it.
+ * `push(chunk)` returns the offset in `chunk` just past the closing bracket, or -1 while no value
+ * has closed yet; the parsed value is then available as `value`.
+ * When given, `onChild(start, end, rootStart)` is called with the offsets (counted over everything
+ * pushed so far) of each array or object nested directly inside the top-level value, as soon as it
+ * closes, along with the offset where the top-level value itself starts.
+ */
+export function createJsonScanner({ open, onChild }) {
+  let depth = 0
+  let inString = false
+  let escaped = false
+  let pos = 0
+  let rootStart = 0
+  let childStart = 0
+  // Text of the top-level value seen in earlier chunks, parsed once it closes.
+  let candidate = ''
+  let value
+
+  return {
+    get value() {
+      return value
+    },
+
+    push(chunk) {
+      let from = 0
+      for (let i = 0; i < chunk.length; i++, pos++) {
+        const c = chunk[i]
+        if (depth === 0) {
+          if (c === open) {
+            depth = 1
+            rootStart = pos
+            candidate = ''
+            from = i
+          }
+          continue
+        }
+        if (inString) {
+          if (escaped) escaped = false
+          else if (c === '\\') escaped = true
+          else if (c === '"') inString = false
+          continue
+        }
+        if (c === '"') inString = true
+        else if (c === '[' || c === '{') {
+          if (++depth === 2) childStart = pos
+        } else if (c === ']' || c === '}') {
+          if (--depth === 0) {
+            try {
+              value = JSON.parse(candidate + chunk.slice(from, i + 1))
+            } catch {
+              continue
+            }
+            pos++
+            return i + 1
+          }
+          if (depth === 1) onChild?.(childStart, pos + 1, rootStart)
+        }
+      }
+      if (depth > 0) candidate += chunk.slice(from)
+      return -1
+    },
+  }
+}
+
+/**
+ * Parse the first valid JSON value starting with `open` ('[' or '{') in `text`, in a single pass and
+ * ignoring any prose before or after it. Returns undefined when no complete, valid value is found.
+ */
+export function extractJson(text, open) {
+  const scanner = createJsonScanner({ open })
+  return scanner.push(text) === -1 ? undefined : scanner.value
+}
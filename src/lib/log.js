@@ -0,0 +1,3 @@
+
+// Debug logging that only runs in the dev server; production builds keep just warnings and errors.
+export const debug = import.meta.env.DEV ? console.log.bind(console) : () => {}
@@ -3,6 +3,7 @@ import { motion, AnimatePresence } from 'framer-motion'
 import { AppShell } from '../components/AppShell.jsx'
 import { generateInvestorsWithAnthropic, generatePitchDeckWithAnthropic, generateMarketResearchWithAnthropic } from '../lib/anthropic.js'
 import { SlideViewer } from '../components/SlideViewer.jsx'
+import { debug } from '../lib/log.js'
 import jsPDF from 'jspdf'
 import html2canvas from 'html2canvas'
 
@@ -50,6 +51,165 @@ function useProfile() {
   }, [])
 }
 
+const PLACEHOLDER_API_KEY = 'sk-ant-REDACTED'
+
+// Key entered in the Profile section, falling back to one provided by the environment.
+function resolveApiKey() {
+  const key = (sessionStorage.getItem('anthropic-api-key') || window?.ANTHROPIC_API_KEY || import.meta.env.VITE_ANTHROPIC_API_KEY || '').trim()
+  return key === PLACEHOLDER_API_KEY ? '' : key
+}
+
+// Branding calendar building blocks; the helpers below live outside the component so they
+// aren't recreated on every render.
+const MONTH_NAMES = [
+  'January', 'February', 'March', 'April', 'May', 'June',
+  'July', 'August', 'September', 'October', 'November', 'December'
+]
+
+const DAYS_OF_WEEK = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+const WEEK_THEMES = {
+  'Professional': ['Problem Awareness', 'Solution Showcase', 'Industry Insights', 'Company Milestones'],
+  'Friendly': ['Community Building', 'Behind the Scenes', 'Customer Stories', 'Team Culture'],
+  'Innovative': ['Future Vision', 'Tech Deep Dives', 'Trend Analysis', 'Innovation Stories'],
+  'Luxury': ['Premium Positioning', 'Exclusive Insights', 'Quality Focus', 'Brand Heritage'],
+  'Casual': ['Daily Life', 'Fun Facts', 'User Stories', 'Relatable Content']
+}
+
+const POST_TYPES = ['LinkedIn', 'Instagram']
+
+// Create branding calendar data
+function createBrandingCalendar(profile) {
+  const currentDate = new Date()
+  const currentMonth = currentDate.getMonth()
+  const currentYear = currentDate.getFullYear()
+  
+  // Get the next month
+  const nextMonth = currentMonth === 11 ? 0 : currentMonth + 1
+  const nextMonthYear = currentMonth === 11 ? currentYear + 1 : currentYear
+  
+  const calendar = {
+    month: MONTH_NAMES[nextMonth],
+    year: nextMonthYear,
+    startupName: profile.startupName,
+    brandTone: profile.brandTone,
+    problem: profile.problem,
+    solution: profile.solution,
+    weeks: []
+  }
+
+  // Generate 4 weeks of content
+  for (let week = 1; week <= 4; week++) {
+    const weekData = {
+      weekNumber: week,
+      theme: getWeekTheme(week, profile.brandTone),
+      posts: []
+    }
+
+    // Generate 3-4 posts per week
+    const postsPerWeek = week === 1 ? 4 : 3 // First week gets more posts for launch
+    for (let post = 1; post <= postsPerWeek; post++) {
+      weekData.posts.push(generatePost(post, week, profile))
+    }
+
+    calendar.weeks.push(weekData)
+  }
+
+  return calendar
+}
+
+function getWeekTheme(week, brandTone) {
+  return WEEK_THEMES[brandTone]?.[week - 1] || WEEK_THEMES['Professional'][week - 1]
+}
+
+function generatePost(postNumber, week, profile) {
+  const postType = POST_TYPES[Math.floor(Math.random() * POST_TYPES.length)]
+  const day = getDayOfWeek(week, postNumber)
+
+  const postTemplates = {
+    'LinkedIn': [
+      {
+        title: `How ${profile.startupName} is solving ${profile.problem}`,
+        content: `🚀 Excited to share how we're tackling one of the biggest challenges in our industry. ${profile.problem} affects millions, and we're building the solution. #Innovation #Startup #ProblemSolving`,
+        hashtags: ['#Innovation', '#Startup', '#ProblemSolving', '#Tech', '#Future'],
+        platform: 'LinkedIn',
+        engagement: 'High',
+        timing: '9:00 AM',
+        day
+      },
+      {
+        title: `Behind the scenes at ${profile.startupName}`,
+        content: `💡 Ever wondered what goes into building a game-changing solution? Here's a peek into our development process and the team making it happen. #BehindTheScenes #TeamWork #Innovation`,
+        hashtags: ['#BehindTheScenes', '#TeamWork', '#Innovation', '#StartupLife', '#Building'],
+        platform: 'LinkedIn',
+        engagement: 'Medium',
+        timing: '2:00 PM',
+        day
+      },
+      {
+        title: `Industry insights: The future of our space`,
+        content: `🔮 We're not just building a product, we're shaping the future. Here's what we see coming in the next 5 years and how ${profile.startupName} fits into that vision. #FutureOfTech #IndustryInsights #Innovation`,
+        hashtags: ['#FutureOfTech', '#IndustryInsights', '#Innovation', '#Trends', '#Vision'],
+        platform: 'LinkedIn',
+        engagement: 'High',
+        timing: '11:00 AM',
+        day
+      },
+      {
+        title: `Customer success story`,
+        content: `🎉 Nothing makes us happier than seeing our solution make a real difference. Here's how we helped one customer overcome ${profile.problem} and achieve their goals. #CustomerSuccess #Impact #Results`,
+        hashtags: ['#CustomerSuccess', '#Impact', '#Results', '#Testimonial', '#Success'],
+        platform: 'LinkedIn',
+        engagement: 'High',
+        timing: '3:00 PM',
+        day
+      }
+    ],
+    'Instagram': [
+      {
+        title: `Visual story: Our journey so far`,
+        content: `📸 From idea to reality - here's the visual story of how ${profile.startupName} came to life. Swipe to see our evolution! #StartupJourney #VisualStory #Innovation`,
+        hashtags: ['#StartupJourney', '#VisualStory', '#Innovation', '#BehindTheScenes', '#Story'],
+        platform: 'Instagram',
+        engagement: 'High',
+        timing: '12:00 PM',
+        day
+      },
+      {
+        title: `Team spotlight`,
+        content: `👥 Meet the amazing people behind ${profile.startupName}! Every great solution starts with a great team. #TeamSpotlight #StartupTeam #Innovation`,
+        hashtags: ['#TeamSpotlight', '#StartupTeam', '#Innovation', '#People', '#Culture'],
+        platform: 'Instagram',
+        engagement: 'Medium',
+        timing: '6:00 PM',
+        day
+      },
+      {
+        title: `Product showcase`,
+        content: `✨ Here's what we've been building! ${profile.startupName} in action, solving ${profile.problem} one step at a time. #ProductShowcase #Innovation #Solution`,
+        hashtags: ['#ProductShowcase', '#Innovation', '#Solution', '#Tech', '#Product'],
+        platform: 'Instagram',
+        engagement: 'High',
+        timing: '10:00 AM',
+        day
+      }
+    ]
+  }
+
+  const template = postTemplates[postType][Math.floor(Math.random() * postTemplates[postType].length)]
+  return {
+    ...template,
+    id: `week${week}-post${postNumber}`,
+    week: week,
+    postNumber: postNumber
+  }
+}
+
+function getDayOfWeek(week, postNumber) {
+  const startDay = (week - 1) * 7
+  return DAYS_OF_WEEK[(startDay + postNumber - 1) % 7]
+}
+
 export function Dashboard() {
   const profile = useProfile()
   const [active, setActive] = useState('profile')
@@ -61,6 +221,15 @@ export function Dashboard() {
   const [pitchError, setPitchError] = useState('')
   const [showSlideViewer, setShowSlideViewer] = useState(false)
   const [currentSlideIndex, setCurrentSlideIndex] = useState(0)
+
+  // Derived once per deck rather than on every Dashboard render while the viewer is open
+  const viewerSlides = useMemo(() => pitchSlides.map(slide => ({
+    ...slide,
+    startupName: profile.startupName || 'Startup',
+    description: slide.subtitle,
+    bullets: slide.bullets || [],
+    metrics: slide.metrics || {}
+  })), [pitchSlides, profile.startupName])
   
   // Market Research State
   const [marketResearch, setMarketResearch] = useState(null)
@@ -74,7 +243,7 @@ export function Dashboard() {
   const [brandingError, setBrandingError] = useState('')
   
   // API Key State
-  const [apiKey, setApiKey] = useState(sessionStorage.getItem('anthropic-api-key') || '')
+  const [apiKey, setApiKey] = useState(() => sessionStorage.getItem('anthropic-api-key') || '')
   const [showApiKeyInput, setShowApiKeyInput] = useState(!apiKey)
   
   // Pre-populate API key if not set (for development/demo purposes)
@@ -82,26 +251,26 @@ export function Dashboard() {
     if (!apiKey && !sessionStorage.getItem('anthropic-api-key')) {
       // Check for environment variable or use placeholder
       const envKey = import.meta.env.VITE_ANTHROPIC_API_KEY
-      console.log('Environment API Key:', envKey ? 'Present' : 'Missing')
-      console.log('API Key length:', envKey ? envKey.length : 0)
+      debug('Environment API Key:', envKey ? 'Present' : 'Missing')
+      debug('API Key length:', envKey ? envKey.length : 0)
       
       // Temporary: Use the known working API key for testing
       const workingKey = null // Set your API key here for testing
       
-      if (envKey && envKey.startsWith('sk-ant-api03-') && envKey !== 'sk-ant-REDACTED') {
-        console.log('Setting API key from environment')
+      if (envKey && envKey.startsWith('sk-ant-api03-') && envKey !== PLACEHOLDER_API_KEY) {
+        debug('Setting API key from environment')
         setApiKey(envKey)
         sessionStorage.setItem('anthropic-api-key', envKey)
         window.ANTHROPIC_API_KEY = envKey
         setShowApiKeyInput(false)
       } else if (workingKey && workingKey.startsWith('sk-ant-api03-')) {
-        console.log('Using working API key for testing')
+        debug('Using working API key for testing')
         setApiKey(workingKey)
         sessionStorage.setItem('anthropic-api-key', workingKey)
         window.ANTHROPIC_API_KEY = workingKey
         setShowApiKeyInput(false)
       } else {
-        console.log('No valid environment key, showing input')
+        debug('No valid environment key, showing input')
         // Show API key input if no valid key is found
         setShowApiKeyInput(true)
       }
@@ -150,152 +319,6 @@ export function Dashboard() {
     }, 2000)
   }
 
-  // Create branding calendar data
-  const createBrandingCalendar = (profile) => {
-    const currentDate = new Date()
-    const currentMonth = currentDate.getMonth()
-    const currentYear = currentDate.getFullYear()
-    
-    // Get the next month
-    const nextMonth = currentMonth === 11 ? 0 : currentMonth + 1
-    const nextMonthYear = currentMonth === 11 ? currentYear + 1 : currentYear
-    
-    const monthNames = [
-      'January', 'February', 'March', 'April', 'May', 'June',
-      'July', 'August', 'September', 'October', 'November', 'December'
-    ]
-
-    const calendar = {
-      month: monthNames[nextMonth],
-      year: nextMonthYear,
-      startupName: profile.startupName,
-      brandTone: profile.brandTone,
-      problem: profile.problem,
-      solution: profile.solution,
-      weeks: []
-    }
-
-    // Generate 4 weeks of content
-    for (let week = 1; week <= 4; week++) {
-      const weekData = {
-        weekNumber: week,
-        theme: getWeekTheme(week, profile.brandTone),
-        posts: []
-      }
-
-      // Generate 3-4 posts per week
-      const postsPerWeek = week === 1 ? 4 : 3 // First week gets more posts for launch
-      for (let post = 1; post <= postsPerWeek; post++) {
-        weekData.posts.push(generatePost(post, week, profile))
-      }
-
-      calendar.weeks.push(weekData)
-    }
-
-    return calendar
-  }
-
-  const getWeekTheme = (week, brandTone) => {
-    const themes = {
-      'Professional': ['Problem Awareness', 'Solution Showcase', 'Industry Insights', 'Company Milestones'],
-      'Friendly': ['Community Building', 'Behind the Scenes', 'Customer Stories', 'Team Culture'],
-      'Innovative': ['Future Vision', 'Tech Deep Dives', 'Trend Analysis', 'Innovation Stories'],
-      'Luxury': ['Premium Positioning', 'Exclusive Insights', 'Quality Focus', 'Brand Heritage'],
-      'Casual': ['Daily Life', 'Fun Facts', 'User Stories', 'Relatable Content']
-    }
-    
-    return themes[brandTone]?.[week - 1] || themes['Professional'][week - 1]
-  }
-
-  const generatePost = (postNumber, week, profile) => {
-    const postTypes = ['LinkedIn', 'Instagram']
-    const postType = postTypes[Math.floor(Math.random() * postTypes.length)]
-    
-    const postTemplates = {
-      'LinkedIn': [
-        {
-          title: `How ${profile.startupName} is solving ${profile.problem}`,
-          content: `🚀 Excited to share how we're tackling one of the biggest challenges in our industry. ${profile.problem} affects millions, and we're building the solution. #Innovation #Startup #ProblemSolving`,
-          hashtags: ['#Innovation', '#Startup', '#ProblemSolving', '#Tech', '#Future'],
-          platform: 'LinkedIn',
-          engagement: 'High',
-          timing: '9:00 AM',
-          day: getDayOfWeek(week, postNumber)
-        },
-        {
-          title: `Behind the scenes at ${profile.startupName}`,
-          content: `💡 Ever wondered what goes into building a game-changing solution? Here's a peek into our development process and the team making it happen. #BehindTheScenes #TeamWork #Innovation`,
-          hashtags: ['#BehindTheScenes', '#TeamWork', '#Innovation', '#StartupLife', '#Building'],
-          platform: 'LinkedIn',
-          engagement: 'Medium',
-          timing: '2:00 PM',
-          day: getDayOfWeek(week, postNumber)
-        },
-        {
-          title: `Industry insights: The future of our space`,
-          content: `🔮 We're not just building a product, we're shaping the future. Here's what we see coming in the next 5 years and how ${profile.startupName} fits into that vision. #FutureOfTech #IndustryInsights #Innovation`,
-          hashtags: ['#FutureOfTech', '#IndustryInsights', '#Innovation', '#Trends', '#Vision'],
-          platform: 'LinkedIn',
-          engagement: 'High',
-          timing: '11:00 AM',
-          day: getDayOfWeek(week, postNumber)
-        },
-        {
-          title: `Customer success story`,
-          content: `🎉 Nothing makes us happier than seeing our solution make a real difference. Here's how we helped one customer overcome ${profile.problem} and achieve their goals. #CustomerSuccess #Impact #Results`,
-          hashtags: ['#CustomerSuccess', '#Impact', '#Results', '#Testimonial', '#Success'],
-          platform: 'LinkedIn',
-          engagement: 'High',
-          timing: '3:00 PM',
-          day: getDayOfWeek(week, postNumber)
-        }
-      ],
-      'Instagram': [
-        {
-          title: `Visual story: Our journey so far`,
-          content: `📸 From idea to reality - here's the visual story of how ${profile.startupName} came to life. Swipe to see our evolution! #StartupJourney #VisualStory #Innovation`,
-          hashtags: ['#StartupJourney', '#VisualStory', '#Innovation', '#BehindTheScenes', '#Story'],
-          platform: 'Instagram',
-          engagement: 'High',
-          timing: '12:00 PM',
-          day: getDayOfWeek(week, postNumber)
-        },
-        {
-          title: `Team spotlight`,
-          content: `👥 Meet the amazing people behind ${profile.startupName}! Every great solution starts with a great team. #TeamSpotlight #StartupTeam #Innovation`,
-          hashtags: ['#TeamSpotlight', '#StartupTeam', '#Innovation', '#People', '#Culture'],
-          platform: 'Instagram',
-          engagement: 'Medium',
-          timing: '6:00 PM',
-          day: getDayOfWeek(week, postNumber)
-        },
-        {
-          title: `Product showcase`,
-          content: `✨ Here's what we've been building! ${profile.startupName} in action, solving ${profile.problem} one step at a time. #ProductShowcase #Innovation #Solution`,
-          hashtags: ['#ProductShowcase', '#Innovation', '#Solution', '#Tech', '#Product'],
-          platform: 'Instagram',
-          engagement: 'High',
-          timing: '10:00 AM',
-          day: getDayOfWeek(week, postNumber)
-        }
-      ]
-    }
-
-    const template = postTemplates[postType][Math.floor(Math.random() * postTemplates[postType].length)]
-    return {
-      ...template,
-      id: `week${week}-post${postNumber}`,
-      week: week,
-      postNumber: postNumber
-    }
-  }
-
-  const getDayOfWeek = (week, postNumber) => {
-    const days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    const startDay = (week - 1) * 7
-    return days[(startDay + postNumber - 1) % 7]
-  }
-
   // PDF Export Function for Market Research
   const exportMarketResearchToPDF = async () => {
     if (!marketResearch) return
@@ -856,7 +879,7 @@ export function Dashboard() {
                 <button
                   className="bg-gradient-to-r from-purple-600 to-pink-600 hover:from-purple-700 hover:to-pink-700 text-white font-bold py-4 px-8 rounded-2xl text-lg shadow-2xl transform hover:scale-105 transition-all duration-300 border-2 border-purple-400/30"
                   onClick={async () => {
-                    if (!profile?.problem) {
+                    if (!profile?.problem?.trim()) {
                       setMarketResearchError('Please complete your startup profile with a problem statement first')
                       return
                     }
@@ -866,11 +889,11 @@ export function Dashboard() {
                     setMarketResearch(null)
                     
                     try {
-                      const apiKey = (sessionStorage.getItem('anthropic-api-key') || window?.ANTHROPIC_API_KEY || import.meta.env.VITE_ANTHROPIC_API_KEY || '').trim()
+                      const apiKey = resolveApiKey()
                       
-                      console.log('API Key check:', { hasKey: !!apiKey, keyLength: apiKey?.length, isPlaceholder: apiKey === 'sk-ant-REDACTED' })
+                      debug('API Key check:', { hasKey: !!apiKey, keyLength: apiKey.length })
                       
-                      if (!apiKey || apiKey === 'sk-ant-REDACTED') {
+                      if (!apiKey) {
                         setMarketResearchError('Please enter a valid Anthropic API key in the Profile section above')
                         setMarketResearchLoading(false)
                         return
@@ -880,11 +903,17 @@ export function Dashboard() {
                         profile, 
                         problemStatement: profile.problem,
                         userAnswers: [],
-                        apiKey 
+                        apiKey,
+                        // Clicking again with a report on screen asks for a fresh one
+                        bypassCache: !!marketResearch,
+                        // Render sections as they stream in; the final report replaces this below
+                        onProgress: setMarketResearch,
                       })
                       setMarketResearch(report)
                     } catch (e) {
                       console.error('Market research error:', e)
+                      // Drop the partially streamed report so it can't be exported as if complete
+                      setMarketResearch(null)
                       if (e?.message?.includes('401') || e?.message?.includes('authentication_error')) {
                         setMarketResearchError('Invalid API key. Please check your Anthropic API key in the Profile section above.')
                       } else {
@@ -1159,7 +1188,7 @@ export function Dashboard() {
                     {/* PDF Export Button */}
                     <button
                       onClick={exportMarketResearchToPDF}
-                      disabled={pdfGenerating}
+                      disabled={pdfGenerating || marketResearchLoading}
                       className="bg-gradient-to-r from-green-600 to-emerald-600 hover:from-green-700 hover:to-emerald-700 disabled:from-green-800 disabled:to-emerald-800 text-white font-bold py-3 px-6 rounded-2xl text-lg shadow-2xl transform hover:scale-105 disabled:scale-100 transition-all duration-300 border-2 border-green-400/30 disabled:border-green-600/30"
                     >
                       {pdfGenerating ? (
@@ -1196,20 +1225,29 @@ export function Dashboard() {
                     setPitchSlides([])
                     setCurrentSlideIndex(0)
                     try {
-                      const apiKey = (sessionStorage.getItem('anthropic-api-key') || window?.ANTHROPIC_API_KEY || import.meta.env.VITE_ANTHROPIC_API_KEY || '').trim()
+                      const apiKey = resolveApiKey()
                       
-                      if (!apiKey || apiKey === 'sk-ant-REDACTED') {
+                      if (!apiKey) {
                         setPitchError('Please enter a valid Anthropic API key in the Profile section above')
                         setPitchLoading(false)
                         return
                       }
                       
-                      console.log('API Key:', apiKey ? 'Present' : 'Missing')
-                      const slides = await generatePitchDeckWithAnthropic({ profile, apiKey })
-                      console.log('Generated slides:', slides)
+                      debug('API Key:', apiKey ? 'Present' : 'Missing')
+                      const slides = await generatePitchDeckWithAnthropic({
+                        profile,
+                        apiKey,
+                        bypassCache: pitchSlides.length > 0,
+                        // Show slides as they stream in; the full deck replaces them below
+                        onSlide: (slide) => setPitchSlides((prev) => [...prev, slide]),
+                      })
+                      debug('Generated slides:', slides)
                       setPitchSlides(Array.isArray(slides) ? slides : [])
                     } catch (e) {
                       console.error('Pitch deck error:', e)
+                      // Drop slides streamed before the failure rather than show a partial deck
+                      setPitchSlides([])
+                      setCurrentSlideIndex(0)
                       if (e?.message?.includes('401') || e?.message?.includes('authentication_error')) {
                         setPitchError('Invalid API key. Please check your Anthropic API key in the Profile section above.')
                       } else {
@@ -1312,7 +1350,7 @@ export function Dashboard() {
                         )}
 
                         {/* Bullet Points */}
-                        {pitchSlides[currentSlideIndex]?.bullets && pitchSlides[currentSlideIndex]?.bullets.length > 0 && (
+                        {pitchSlides[currentSlideIndex]?.bullets.length > 0 && (
                           <div className="grid grid-cols-2 gap-4">
                             {pitchSlides[currentSlideIndex]?.bullets.slice(0, 4).map((bullet, index) => (
                               <div key={index} className="flex items-start gap-3 bg-gray-50 rounded-xl p-3">
@@ -1324,7 +1362,7 @@ export function Dashboard() {
                         )}
 
                         {/* Metrics */}
-                        {pitchSlides[currentSlideIndex]?.metrics && typeof pitchSlides[currentSlideIndex]?.metrics === 'object' && (
+                        {pitchSlides[currentSlideIndex]?.metrics && (
                           <div className="grid grid-cols-2 gap-4">
                             {Object.entries(pitchSlides[currentSlideIndex]?.metrics).slice(0, 4).map(([key, value]) => (
                               <div key={key} className="bg-purple-50 rounded-xl p-4 border border-purple-200">
@@ -1358,7 +1396,7 @@ export function Dashboard() {
                     >
                       <div className="flex items-start justify-between gap-3">
                         <div>
-                          <div className="text-white/70 text-xs">Slide {s?.number || idx + 1}</div>
+                          <div className="text-white/70 text-xs">Slide {s.number}</div>
                           <div className="text-white font-medium">{s?.title || 'Untitled'}</div>
                         </div>
                         <div className="text-xs rounded-full px-2 py-1 bg-purple-400/15 border border-purple-400/20 text-white/80">
@@ -1369,11 +1407,11 @@ export function Dashboard() {
                         <div className="text-white/70 text-sm mt-2">{s.subtitle}</div>
                       )}
                       <ul className="mt-3 space-y-2 list-disc list-inside text-sm text-white/90">
-                        {(Array.isArray(s?.bullets) ? s.bullets : String(s?.bullets || '').split(/\n|•|\-/).filter(Boolean)).slice(0, 6).map((b, i) => (
-                          <li key={i}>{String(b).trim()}</li>
+                        {s.bullets.slice(0, 6).map((b, i) => (
+                          <li key={i}>{b}</li>
                         ))}
                       </ul>
-                      {s?.metrics && typeof s.metrics === 'object' && (
+                      {s.metrics && (
                         <div className="mt-3 flex flex-wrap gap-2">
                           {Object.entries(s.metrics).slice(0, 6).map(([k, v]) => (
                             <span key={k} className="text-xs rounded-full px-2 py-1 bg-white/5 border border-white/10">{k}: {String(v)}</span>
@@ -1403,9 +1441,9 @@ export function Dashboard() {
                     setIsLoading(true)
                     setInvestors([])
                     try {
-                      const apiKey = (sessionStorage.getItem('anthropic-api-key') || window?.ANTHROPIC_API_KEY || import.meta.env.VITE_ANTHROPIC_API_KEY || '').trim()
+                      const apiKey = resolveApiKey()
                       
-                      if (!apiKey || apiKey === 'sk-ant-REDACTED') {
+                      if (!apiKey) {
                         setError('Please enter a valid Anthropic API key in the Profile section above')
                         setIsLoading(false)
                         return
@@ -1421,9 +1459,16 @@ export function Dashboard() {
                               ? 'seed'
                               : 'seed-or-series-a',
                       }
-                      const results = await generateInvestorsWithAnthropic({ profile: enrichedProfile, apiKey })
+                      const results = await generateInvestorsWithAnthropic({
+                        profile: enrichedProfile,
+                        apiKey,
+                        bypassCache: investors.length > 0,
+                        onInvestor: (inv) => setInvestors((prev) => [...prev, inv]),
+                      })
                       setInvestors(results)
                     } catch (e) {
+                      // Drop investors streamed before the failure rather than show a partial list
+                      setInvestors([])
                       if (e?.message?.includes('401') || e?.message?.includes('authentication_error')) {
                         setError('Invalid API key. Please check your Anthropic API key in the Profile section above.')
                       } else {
@@ -1482,13 +1527,7 @@ export function Dashboard() {
       {showSlideViewer && (
         <div className="fixed inset-0 z-50">
           <SlideViewer 
-            slides={pitchSlides.map(slide => ({
-              ...slide,
-              startupName: profile.startupName || 'Startup',
-              description: slide.subtitle,
-              bullets: slide.bullets || [],
-              metrics: slide.metrics || {}
-            }))} 
+            slides={viewerSlides} 
           />
           <button
             onClick={() => setShowSlideViewer(false)}
@@ -4,6 +4,9 @@ import { motion, AnimatePresence } from 'framer-motion'
 import { AppShell } from '../components/AppShell.jsx'
 import { BackgroundOrbs } from '../components/BackgroundOrbs.jsx'
 import { Logo } from '../components/Logo.jsx'
+import { MAX_PROBLEM_STATEMENT_LENGTH } from '../lib/anthropic.js'
+
+const LINKEDIN_URL_RE = /^https?:\/\/.+linkedin\.com\//i
 
 const brandTones = [
   { key: 'professional', label: 'Professional' },
@@ -36,7 +39,7 @@ export function Onboarding() {
     const nextErrors = {}
     if (!form.problem.trim()) nextErrors.problem = 'Required'
     if (!form.solution.trim()) nextErrors.solution = 'Required'
-    if (!/^https?:\/\/.+linkedin\.com\//i.test(form.linkedin.trim())) nextErrors.linkedin = 'Valid LinkedIn URL required'
+    if (!LINKEDIN_URL_RE.test(form.linkedin.trim())) nextErrors.linkedin = 'Valid LinkedIn URL required'
     setErrors(nextErrors)
     return Object.keys(nextErrors).length === 0
   }
@@ -126,7 +129,7 @@ export function Onboarding() {
 
               <div>
                 <div className="label mb-2">One-line problem<span className="text-hot">*</span></div>
-                <input className="input" placeholder="What pain are you killing?" value={form.problem} onChange={(e) => updateField('problem', e.target.value)} />
+                <input className="input" placeholder="What pain are you killing?" maxLength={MAX_PROBLEM_STATEMENT_LENGTH} value={form.problem} onChange={(e) => updateField('problem', e.target.value)} />
                 {errors.problem && <p className="text-xs text-pink-400 mt-1">{errors.problem}</p>}
               </div>
               <div>